@@ -0,0 +1,17 @@
+import os
+import unittest
+from unittest import mock
+
+from transcriber import cli
+
+
+class StaticHelpTest(unittest.TestCase):
+    def test_static_help_matches_argparse(self):
+        # argparse wraps to the terminal width; _HELP is written for 80 columns.
+        with mock.patch.dict(os.environ, {"COLUMNS": "80"}):
+            expected = cli._build_parser("vid2txt").format_help()
+        self.assertEqual(cli._help_text("vid2txt") + "\n", expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
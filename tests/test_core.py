@@ -0,0 +1,47 @@
+import io
+import os
+import tempfile
+import unittest
+
+from transcriber import core
+
+
+class WritePiecesTest(unittest.TestCase):
+    def assertWritesStripped(self, pieces):
+        f = io.StringIO()
+        core._write_pieces(f, pieces)
+        text = "".join(pieces).strip()
+        self.assertEqual(f.getvalue(), text + "\n" if text else "")
+
+    def test_segments_with_leading_space(self):
+        self.assertWritesStripped([" Hello", " world.", " Bye."])
+
+    def test_leading_and_trailing_whitespace(self):
+        self.assertWritesStripped(["  \n Hello ", "world \n", " \t"])
+
+    def test_whitespace_only_pieces_between_text(self):
+        self.assertWritesStripped(["a", " ", "\n", "", "b", "  "])
+
+    def test_whitespace_only_input(self):
+        self.assertWritesStripped([" ", "\n", ""])
+
+    def test_empty_input(self):
+        self.assertWritesStripped([])
+
+
+
+class AtomicWriteTest(unittest.TestCase):
+    def test_transcript_gets_umask_permissions(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, "a.txt")
+            with core._atomic_write(out) as fd:
+                os.write(fd, b"text\n")
+            with open(out, "rb") as f:
+                self.assertEqual(f.read(), b"text\n")
+            if os.name == "posix":
+                self.assertEqual(os.stat(out).st_mode & 0o777, 0o666 & ~core._UMASK)
+            self.assertEqual(os.listdir(tmp), ["a.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
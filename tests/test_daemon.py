@@ -0,0 +1,108 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest import mock
+
+from transcriber import core, daemon
+
+
+class _FakeModel:
+    def transcribe(self, path, **kwargs):
+        if not os.path.isfile(path):
+            raise RuntimeError(f"Failed to load audio: {path}")
+        return {"text": f" text of {os.path.basename(path)} "}
+
+
+def _fake_whisper():
+    """Stand-in for openai-whisper that counts model loads."""
+    mod = types.ModuleType("whisper")
+    mod.loads = []
+    mod.load_model = lambda name, device=None: mod.loads.append(name) or _FakeModel()
+    return mod
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets only")
+class DaemonRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        os.chmod(self.tmp, 0o700)
+        self.path = os.path.join(self.tmp, "run", "daemon.sock")
+
+        self.whisper = _fake_whisper()
+        patcher = mock.patch.dict(sys.modules, {"whisper": self.whisper})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(core.clear_model_cache)
+        self.addCleanup(setattr, daemon, "_model_key", None)
+
+        with mock.patch("sys.stderr"):
+            self.server = daemon._bind(self.path)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _request(self, req):
+        sock = daemon.connect(self.path)
+        self.assertIsNotNone(sock)
+        with mock.patch("sys.stderr"):
+            return daemon.request(sock, req)
+
+    def _job(self, name, model="small"):
+        media = os.path.join(self.tmp, name)
+        with open(media, "wb"):
+            pass
+        out = os.path.join(self.tmp, name + ".txt")
+        return {"input": media, "output": out, "model": model, "device": "cpu", "backend": "whisper"}
+
+    def test_transcribes_and_reuses_model(self):
+        for name in ("a.mp3", "b.mp3"):
+            req = self._job(name)
+            self.assertEqual(self._request(req), {"ok": True, "output": req["output"]})
+            with open(req["output"], encoding="utf-8") as f:
+                self.assertEqual(f.read(), f"text of {name}\n")
+        self.assertEqual(self.whisper.loads, ["small"])
+
+    def test_switching_model_drops_previous_one(self):
+        self._request(self._job("a.mp3", model="small"))
+        self._request(self._job("a.mp3", model="medium"))
+        self.assertEqual(self.whisper.loads, ["small", "medium"])
+        self.assertEqual(len(core._MODEL_CACHE), 1)
+
+    def test_error_reply(self):
+        req = self._job("a.mp3")
+        req["input"] = os.path.join(self.tmp, "missing.mp3")
+        reply = self._request(req)
+        self.assertFalse(reply["ok"])
+        self.assertFalse(os.path.exists(req["output"]))
+
+    def test_non_object_request_is_rejected(self):
+        sock = daemon.connect(self.path)
+        with sock, sock.makefile("rwb") as f:
+            f.write(b"[]\n")
+            f.flush()
+            reply = json.loads(f.readline())
+        self.assertEqual(reply, {"ok": False, "err": "Invalid request."})
+
+    def test_second_daemon_refuses_to_start(self):
+        with self.assertRaises(SystemExit):
+            daemon._bind(self.path)
+        sock = daemon.connect(self.path)
+        self.assertIsNotNone(sock)
+        sock.close()
+
+    def test_client_ignores_socket_in_shared_dir(self):
+        os.chmod(os.path.dirname(self.path), 0o755)
+        self.addCleanup(os.chmod, os.path.dirname(self.path), 0o700)
+        self.assertIsNone(daemon.connect(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,26 +11,79 @@ Responsibilities:
 Note: focused on I/O and UX; business logic lives in core.py.
 """
 
-import argparse
 import os
+import stat
 import subprocess  # lightweight check for ffmpeg (python based)
 import sys
-from typing import Union # python <3.10 does not work with or "|" so this solves it hopefully
-from .core import transcribe, TranscribeError
+from types import SimpleNamespace
+from typing import Dict, Optional, Set, Union # python <3.10 does not work with or "|" so this solves it hopefully
+from .core import _atomic_write, BACKENDS, DEFAULT_BATCH_SIZE, DEVICES, MAX_BATCH_SIZE, transcribe_many_to_files, TranscribeError
 
 
-def _check_ffmpeg():
+def _ffmpeg_cache_file() -> str:
+    """Location of the marker remembering a successful ffmpeg check (XDG cache dir)."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_root, "transcriber", "ffmpeg_ok")
+
+# Backends whose decoder was already verified in this process (checks are free after the first).
+_decoder_checked = set()
+
+def _check_ffmpeg(backend: str = "whisper"):
     """
-    Verify that 'ffmpeg' is installed and on PATH by invoking 'ffmpeg -version'.
+    Verify that the media decoder used by the backend is available.
     If it's missing or fails, exit with a clear message.
 
     Why this check:
     - Whisper/faster-whisper rely on ffmpeg to decode media files.
     - Failing early with a clear message improves UX.
+
+    faster-whisper decodes in-process through PyAV (the 'av' package, which bundles
+    the ffmpeg libraries), so for backend 'faster' importing av is enough and no
+    process is spawned. openai-whisper (and WhisperX) shell out to the ffmpeg binary.
+    """
+    if backend in _decoder_checked:
+        return
+    if backend == "faster":
+        try:
+            import av  # noqa: F401  (faster-whisper imports it anyway)
+        except ImportError:
+            sys.exit("PyAV (av) not found; faster-whisper needs it to decode media. Try: pip install '.[faster]'")
+    else:
+        _check_ffmpeg_binary()
+    _decoder_checked.add(backend)
+
+def _check_ffmpeg_binary():
+    """
+    Verify that 'ffmpeg' is installed and on PATH by invoking 'ffmpeg -version'.
+    If it's missing or fails, exit with a clear message.
+
+    The subprocess is only spawned when needed: a successful check is remembered in a
+    small cache file keyed by the ffmpeg binary's path, mtime and size, so warm runs
+    only cost a PATH lookup and one stat.
     """
+    import shutil  # deferred: only needed once the ffmpeg check actually runs
+    path = shutil.which("ffmpeg")
+    if path is None:
+        sys.exit("ffmpeg not found. Install it and ensure it's on $PATH.")
+
+    try:
+        st = os.stat(path)
+        key = f"{path}\t{st.st_mtime_ns}\t{st.st_size}"
+    except OSError:
+        key = None
+
+    cache_file = _ffmpeg_cache_file()
+    if key is not None:
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                if f.read() == key:
+                    return
+        except OSError:
+            pass  # no marker yet (or unreadable): fall through to the real check
+
     try:
         subprocess.run(
-            ["ffmpeg", "-version"],          # give input as list of strings for safety
+            [path, "-version"],              # give input as list of strings for safety
             stdout=subprocess.DEVNULL,       # normal output is trashed in the DEVNULL black hole
             stderr=subprocess.DEVNULL,       # standard error as well (stop cluttering)
             check=True,                      # fail fast on detected error
@@ -40,18 +93,58 @@ def _check_ffmpeg():
         # sys.exit with a string prints the message and exits with code 1.
         sys.exit("ffmpeg not found. Install it and ensure it's on $PATH.")
 
+    if key is None:
+        return
+    # Remember the successful check. Write to a temp file and rename so concurrent runs
+    # never see a half-written marker. The cache is best effort; failures are ignored.
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(key)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+# One stat per candidate path: _resolve_input_path and main() both ask whether the same
+# file exists, so results are remembered for the lifetime of the process.
+_stat_cache: Dict[str, Optional[os.stat_result]] = {}
+
+def _exists(path: str) -> bool:
+    """Return True if path is an existing regular file, stat-ing it at most once."""
+    if path not in _stat_cache:
+        try:
+            _stat_cache[path] = os.stat(path)
+        except (OSError, ValueError):
+            _stat_cache[path] = None
+    st = _stat_cache[path]
+    return st is not None and stat.S_ISREG(st.st_mode)
+
 def _resolve_input_path(user_input: str, indir: str) -> str:
     """
+    If user_input is absolute, use it as-is (it can't live under indir; existence is checked later).
     If user_input exists as given, use it.
     If user_input has a directory component, treat it as a path (even if missing).
     Otherwise, treat it as a bare filename and look in indir/<filename>.
     """
-    if os.path.isfile(user_input):
+    if os.path.isabs(user_input):  # pure string check, no stat
+        return user_input
+    if _exists(user_input):
         return user_input
     if os.path.dirname(user_input):  # user provided a subpath like sub/f.mp4
         return user_input  # let the existence check fail later with a clear message
     return os.path.join(indir, user_input)
 
+# Directories already created (or found) by _ensure_dir in this process. In batch runs every
+# output lands in the same directory, and makedirs would re-issue mkdir syscalls each time.
+_MKDIR_CACHE: Set[str] = set()
+
+def _ensure_dir(d: str) -> None:
+    """os.makedirs(d, exist_ok=True), done at most once per directory. Empty d means cwd."""
+    if d and d not in _MKDIR_CACHE:
+        os.makedirs(d, exist_ok=True)
+        _MKDIR_CACHE.add(d)
+
 def _resolve_output_path(input_path: str, output_arg: Union[str, None], outdir: Union[str, None]) -> str: #str | None, outdir: str) -> str:
     """
     If -o/--output is a path with directories, use it as-is.
@@ -60,96 +153,366 @@ def _resolve_output_path(input_path: str, output_arg: Union[str, None], outdir:
     """
     if output_arg:
         if os.path.dirname(output_arg):
-            os.makedirs(os.path.dirname(output_arg), exist_ok=True)
+            _ensure_dir(os.path.dirname(output_arg))
             return output_arg
-        os.makedirs(outdir, exist_ok=True)
+        _ensure_dir(outdir)
         return os.path.join(outdir, output_arg)
 
+    # os.path rather than PurePath(...).stem, which differs for names ending in a dot ("c." -> "c.").
     name = os.path.splitext(os.path.basename(input_path))[0]
-    os.makedirs(outdir, exist_ok=True)
+    _ensure_dir(outdir)
     return os.path.join(outdir, f"{name}.txt")
 
-def main():
+def _write_transcript(out_path: str, text: str) -> None:
     """
-    Main entry point for the CLI. Defined as a function so it can be reused by
-    the console script entry point (pyproject.toml) and Python -m execution.
+    Write the transcript as UTF-8 text to out_path.
+    A newline is appended if the text doesn't already end with one,
+    which makes CLI pipelines and editors a bit happier.
+    """
+    # Ensure the output directory exists. If no directory is present (just a filename),
+    # os.path.dirname(...) returns "", i.e. the current directory, which needs no creating.
+    _ensure_dir(os.path.dirname(out_path))
+
+    # Encode once and write bytes through a raw fd: no text-mode layer and no `text + "\n"` copy.
+    data = text.encode("utf-8")
+    tail = b"\n" if data and not data.endswith(b"\n") else b""
+    # Written to a temp file that replaces out_path only when complete (see core._atomic_write).
+    # mkstemp opens the file in binary mode (O_BINARY on Windows), so bytes go out unchanged.
+    with _atomic_write(out_path) as fd:
+        for chunk in (data, tail):
+            view = memoryview(chunk)
+            while view:  # os.write may write less than asked
+                view = view[os.write(fd, view):]
+
+def _batch_size(value: str) -> int:
+    """argparse type for --batch-size: an integer between 1 and MAX_BATCH_SIZE."""
+    import argparse  # only called while argparse is parsing, so this is already loaded
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if not 1 <= n <= MAX_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_BATCH_SIZE}")
+    return n
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts such as --threads: an integer >= 1."""
+    import argparse  # only called while argparse is parsing, so this is already loaded
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return n
+
+def _default_backend(device: Union[str, None]) -> str:
+    """
+    Pick the backend when --backend was not given.
+    When --device is cpu or omitted (even if CUDA turns out to be available), prefer
+    faster-whisper when installed: it runs int8-quantized CTranslate2 kernels on CPU, typically
+    several times faster than openai-whisper in FP32, and float16 on GPU.
+    find_spec only looks the package up; nothing is imported here.
+    """
+    import importlib.util  # deferred: not needed when --backend or --diarize is given
+    if device in (None, "cpu") and importlib.util.find_spec("faster_whisper") is not None:
+        print("Using faster-whisper backend (int8 on CPU, float16 on GPU). Pass --backend whisper to use openai-whisper.")
+        return "faster"
+    return "whisper"
+
+def _transcribe_via_daemon(jobs, args) -> bool:
+    """
+    Forward jobs to a running daemon (see daemon.py), one request per file.
+    Returns False if no daemon is reachable, so the caller transcribes in-process.
+    """
+    if args.no_daemon:
+        return False
+    from .daemon import connect, request
+
+    sock = connect()
+    if sock is None:
+        return False
+    for input_path, out_path in jobs:
+        if sock is None:  # one connection per request
+            sock = connect()
+            if sock is None:
+                sys.exit("Transcription daemon stopped. Rerun to transcribe the remaining files in-process.")
+        reply = request(sock, {
+            # the daemon has its own working directory, so send absolute paths
+            "input": os.path.abspath(input_path),
+            "output": os.path.abspath(out_path),
+            "model": args.model,
+            "language": args.language,
+            "device": args.device,
+            "backend": args.backend,
+            "batch_size": args.batch_size,
+            "threads": args.threads,
+            "workers": args.workers,
+        })
+        sock = None
+        if not reply.get("ok"):
+            sys.exit(reply.get("err") or "Transcription daemon failed.")
+        print(f"Done. Transcript written to: {out_path}")
+    return True
+
+# Static copy of _build_parser()'s help as argparse prints it for `vid2txt` in an 80-column
+# terminal, so `-h/--help` can answer without building the parser. tests/test_cli.py checks
+# that it stays in sync; update it when adding or changing arguments. Python 3.13 changed
+# argparse's layout (e.g. `-o, --output OUTPUT`), so there the parser prints its own help.
+_HELP = """\
+usage: {prog} [-h] [-o OUTPUT] [--indir INDIR] [--outdir OUTDIR] [-m MODEL]
+{indent}[-l LANGUAGE] [--device {{cpu,cuda}}]
+{indent}[--backend {{whisper,faster}}] [--batch-size BATCH_SIZE]
+{indent}[--threads THREADS] [--workers WORKERS] [--diarize]
+{indent}[--hf-token HF_TOKEN] [--serve] [--no-daemon]
+{indent}[input ...]
+
+Transcribe video/audio to plain text.
+
+positional arguments:
+  input                 Video/audio filename(s) or complete path(s). If just
+                        filename, it is expected to be in --indir (default:
+                        media)
+
+{options}:
+  -h, --help            show this help message and exit
+  -o OUTPUT, --output OUTPUT
+                        Output .txt filename or path (single input only). If
+                        only filename, it is written to --outdir
+                        (./outputs/<input_basename.txt>).
+  --indir INDIR         Directory to look for inputs when given a bare
+                        filename (default: media)
+  --outdir OUTDIR       Directory to write outputs by default (default:
+                        outputs)
+  -m MODEL, --model MODEL
+                        Model name (tiny, base, small, medium, large, etc.)
+  -l LANGUAGE, --language LANGUAGE
+                        Language code (e.g., en). If omitted, auto-detect.
+  --device {{cpu,cuda}}   Force device (default: auto-detect)
+  --backend {{whisper,faster}}
+                        Backend engine (default: faster if installed and
+                        --device is cpu or omitted, else whisper)
+  --batch-size BATCH_SIZE
+                        Segments decoded per pass with faster-whisper on CUDA,
+                        1-32 (default: 16)
+  --threads THREADS     CPU threads for faster-whisper (default: number of
+                        CPUs)
+  --workers WORKERS     faster-whisper workers (parallel transcriptions,
+                        default: 1)
+  --diarize             Enable speaker diarization (WhisperX + pyannote)
+  --hf-token HF_TOKEN   Hugging Face token for pyannote diarization
+  --serve               Run a transcription daemon on a Unix socket; later
+                        runs use it automatically
+  --no-daemon           Always transcribe in this process, even if a daemon is
+                        running"""
+
+# Option defaults, shared by the argparse parser and the argparse-free fast path in main().
+_DEFAULTS = {
+    "output": None,
+    "indir": "media",
+    "outdir": "outputs",
+    "model": "small",
+    "language": None,
+    "device": None,
+    "backend": None,
+    "batch_size": DEFAULT_BATCH_SIZE,
+    "threads": os.cpu_count() or 4,
+    "workers": 1,
+    "diarize": False,
+    "hf_token": None,
+    "serve": False,
+    "no_daemon": False,
+}
+
+def _help_text(prog: str) -> str:
+    """Fill in _HELP the way argparse would for this prog and Python version."""
+    if sys.version_info >= (3, 13):
+        return _build_parser(prog).format_help().rstrip("\n")
+    return _HELP.format(
+        prog=prog,
+        indent=" " * len(f"usage: {prog} "),  # continuation lines align under the first option
+        options="options" if sys.version_info >= (3, 10) else "optional arguments",
+    )
+
+def _build_parser(prog: Union[str, None] = None):
     """
+    Build the argparse parser. argparse (and what it pulls in) is imported here so the
+    common `vid2txt <input>` call in main() can skip it.
+    """
+    import argparse
+
     # Build the argument parser with helpful descriptions for -h/--help.
-    p = argparse.ArgumentParser(description="Transcribe video/audio to plain text.")
+    # Note: we deliberately use no action="append" options. argparse copies the list on every
+    # occurrence (quadratic for long arg lists); if one is ever needed, use a custom Action
+    # that appends to the list in place instead.
+    p = argparse.ArgumentParser(prog=prog, description="Transcribe video/audio to plain text.")
 
-    # Positional argument: required path to the input media file.
-    p.add_argument("input",
-                   help="Video/audio filename or complete path. If just filename, it is expected to be in --indir (default: media)")
+    # Positional argument: one or more input media files. Several inputs share one model load.
+    # nargs="*" so --serve can run without inputs; otherwise at least one is required (checked below).
+    p.add_argument("input", nargs="*",
+                   help="Video/audio filename(s) or complete path(s). If just filename, it is expected to be in --indir (default: media)")
 
     # Optional output file. If omitted, <input_basename>.txt is derived in outputs folder
     p.add_argument("-o", "--output",
-                   help="Output .txt filename or path. If only filename, it is written to --outdir (./outputs/<input_basename.txt>).")
+                   help="Output .txt filename or path (single input only). If only filename, it is written to --outdir (./outputs/<input_basename.txt>).")
 
     # Optional directory to look for input filename if not specified as path in --output
-    p.add_argument("--indir", default="media",
+    p.add_argument("--indir", default=_DEFAULTS["indir"],
                    help="Directory to look for inputs when given a bare filename (default: media)")
 
     # Optional directory to write the output file to if --output is only specified as filename
-    p.add_argument("--outdir", default="outputs",
+    p.add_argument("--outdir", default=_DEFAULTS["outdir"],
                    help="Directory to write outputs by default (default: outputs)")
 
     # Whisper model name; influences speed/accuracy trade-off.
-    p.add_argument("-m", "--model", default="small",
+    p.add_argument("-m", "--model", default=_DEFAULTS["model"],
                    help="Model name (tiny, base, small, medium, large, etc.)")
 
     # Language code. If omitted, the backend will try to auto-detect.
-    p.add_argument("-l", "--language", default=None,
+    p.add_argument("-l", "--language", default=_DEFAULTS["language"],
                    help="Language code (e.g., en). If omitted, auto-detect.")
 
     # Device selection. If omitted, core will auto-detect (CUDA if available, else CPU).
-    p.add_argument("--device", choices=["cpu", "cuda"], default=None,
+    p.add_argument("--device", choices=DEVICES, default=_DEFAULTS["device"],
                    help="Force device (default: auto-detect)")
 
     # Backend engine: 'whisper' (openai-whisper) or 'faster' (faster-whisper).
-    p.add_argument("--backend", choices=["whisper", "faster"], default="whisper",
-                   help="Backend engine")
-    
-    # transcriber/cli.py (changes)
+    # Left as None so we can tell whether the user chose one (see _default_backend).
+    p.add_argument("--backend", choices=BACKENDS, default=_DEFAULTS["backend"],
+                   help="Backend engine (default: faster if installed and --device is cpu or omitted, "
+                        "else whisper)")
+
+    # Batched decoding for faster-whisper on CUDA; larger batches need more GPU memory.
+    p.add_argument("--batch-size", type=_batch_size, default=_DEFAULTS["batch_size"],
+                   help=f"Segments decoded per pass with faster-whisper on CUDA, 1-{MAX_BATCH_SIZE} (default: {DEFAULT_BATCH_SIZE})")
+
+    # CPU parallelism for faster-whisper (CTranslate2). Threads are per worker; extra workers only
+    # help when several transcriptions run at once, and each adds memory. Both apply to the
+    # batched CUDA pipeline too, where threads mostly matter for audio decoding and VAD.
+    p.add_argument("--threads", type=_positive_int, default=_DEFAULTS["threads"],
+                   help="CPU threads for faster-whisper (default: number of CPUs)")
+    p.add_argument("--workers", type=_positive_int, default=_DEFAULTS["workers"],
+                   help="faster-whisper workers (parallel transcriptions, default: 1)")
+
+    # Speaker diarization (WhisperX + pyannote); the token is needed for the pyannote models.
     p.add_argument("--diarize", action="store_true", help="Enable speaker diarization (WhisperX + pyannote)")
-    p.add_argument("--hf-token", default=None, help="Hugging Face token for pyannote diarization")
+    p.add_argument("--hf-token", default=_DEFAULTS["hf_token"], help="Hugging Face token for pyannote diarization")
+
+    # Daemon mode: keep models loaded across invocations. Later runs forward their jobs to it.
+    p.add_argument("--serve", action="store_true",
+                   help="Run a transcription daemon on a Unix socket; later runs use it automatically")
+    p.add_argument("--no-daemon", action="store_true",
+                   help="Always transcribe in this process, even if a daemon is running")
+
+    return p
+
+def _parse_args(argv):
+    """Parse the full command line with argparse."""
+    p = _build_parser()
+    args = p.parse_args(argv)
+    if not args.serve and not args.input:
+        p.error("the following arguments are required: input")
+    return args
+
+def main():
+    """
+    Main entry point for the CLI. Defined as a function so it can be reused by
+    the console script entry point (pyproject.toml) and Python -m execution.
+    """
+    argv = sys.argv[1:]
+
+    # Fast path: a lone -h/--help prints the static help text without building the parser.
+    if argv[:1] in (["-h"], ["--help"]):
+        print(_help_text(os.path.basename(sys.argv[0])))
+        sys.exit(0)
+
+    # Fast path: the common `vid2txt <input>` call needs only the defaults, so skip argparse.
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        args = SimpleNamespace(input=argv, **_DEFAULTS)
+    else:
+        args = _parse_args(argv)
 
-    # Parse CLI args from sys.argv.
-    args = p.parse_args()
+    if args.serve:
+        from .daemon import serve
+        serve()
+        return
 
-    # Ensure ffmpeg is available before running transcription.
-    _check_ffmpeg()
+    # --diarize always runs WhisperX, so only pick (and announce) a backend when it will be used.
+    if args.backend is None and not args.diarize:
+        args.backend = _default_backend(args.device)
 
-    input_path = _resolve_input_path(args.input, args.indir)
+    # -o/--output names a single file, so it cannot be shared by several inputs.
+    if args.output and len(args.input) > 1:
+        sys.exit("-o/--output can only be used with a single input. Use --outdir for multiple inputs.")
 
-    # check input path early on and exit with clear error message if missing
-    if not os.path.isfile(input_path):
-        # Helpful error showing where we looked
-        tried = [args.input]
-        if args.input == os.path.basename(args.input):  # bare filename
-            tried.append(os.path.join(args.indir, args.input))
-        sys.exit("Input not found. Tried:\n- " + "\n- ".join(tried))
+    # check all input paths early on (before loading any model) and exit with clear error message if missing
+    input_paths = []
+    for user_input in args.input:
+        input_path = _resolve_input_path(user_input, args.indir)
+        if not _exists(input_path):
+            # Helpful error showing where we looked
+            tried = [user_input]
+            if user_input == os.path.basename(user_input):  # bare filename
+                tried.append(os.path.join(args.indir, user_input))
+            sys.exit("Input not found. Tried:\n- " + "\n- ".join(tried))
+        input_paths.append(input_path)
+
+    # Decide where to write each transcript (output paths are known up front, so text can be streamed there):
+    # - If user provided -o/--output, use that.
+    # - Otherwise, use <input_basename>.txt and put into /outputs.
+    jobs = [(input_path, _resolve_output_path(input_path, args.output, args.outdir)) for input_path in input_paths]
+
+    # Inputs with the same stem (talk.mp4 talk.mp3, a/x.mp4 b/x.mp4) map to the same transcript;
+    # refuse before loading any model instead of letting the later one overwrite the earlier.
+    seen: Dict[str, str] = {}
+    for input_path, out_path in jobs:
+        key = os.path.normcase(os.path.abspath(out_path))
+        if key in seen:
+            sys.exit(f"{seen[key]} and {input_path} would both be written to {out_path}. "
+                     "Transcribe them in separate runs with different --outdir.")
+        seen[key] = input_path
 
     # Call the core transcription logic. We separate user-facing errors (TranscribeError)
     # from unexpected ones to provide clearer messages.
-    # ...
+    # Transcripts are written as soon as each file is done, so earlier results survive a later failure.
     try:
+        # The decoder (ffmpeg, or PyAV for faster-whisper) is checked right before transcribing
+        # in this process; jobs forwarded to a daemon are decoded there, so the client skips it.
         if args.diarize:
+            # Diarization goes through WhisperX, which always uses the ffmpeg binary.
+            _check_ffmpeg("whisper")
             from .core import transcribe_diarized
-            text = transcribe_diarized(
-                input_path,
-                model=args.model,
-                language=args.language,
-                device=args.device,
-                hf_token=args.hf_token
-            )
+            for input_path, out_path in jobs:
+                text = transcribe_diarized(
+                    input_path,
+                    model=args.model,
+                    language=args.language,
+                    device=args.device,
+                    hf_token=args.hf_token
+                )
+                _write_transcript(out_path, text)
+                # Success message with the output path.
+                print(f"Done. Transcript written to: {out_path}")
+        elif _transcribe_via_daemon(jobs, args):
+            pass  # a running daemon (--serve) did the work with its already loaded model
         else:
-            text = transcribe(
-                input_path,
+            _check_ffmpeg(args.backend)
+            if args.backend == "faster":
+                # Read by CTranslate2's OpenMP when it is imported; an explicit env var wins.
+                # Only for faster: --threads is documented as a faster-whisper option.
+                os.environ.setdefault("OMP_NUM_THREADS", str(args.threads))
+            # one model load for all inputs; segments are written to disk as they are decoded
+            for out_path in transcribe_many_to_files(
+                jobs,
                 model=args.model,
                 language=args.language,
                 device=args.device,
-                backend=args.backend
-            )
+                backend=args.backend,
+                batch_size=args.batch_size,
+                cpu_threads=args.threads,
+                num_workers=args.workers
+            ):
+                print(f"Done. Transcript written to: {out_path}")
     except TranscribeError as e:
         # Known, user-fixable error (missing dependency, bad params, etc.)
         sys.exit(str(e))
@@ -157,23 +520,6 @@ def main():
         # Unexpected error; include the message for debugging.
         sys.exit(f"Unexpected error: {e}")
 
-    # Decide where to write the transcript:
-    # - If user provided -o/--output, use that.
-    # - Otherwise, use <input_basename>.txt and put into /outputs.
-    out_path = _resolve_output_path(input_path, args.output, args.outdir)
-
-    # Ensure the output directory exists. If no directory is present (just a filename),
-    # os.path.dirname(...) returns "", so we fallback to "." (current directory).
-    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-
-    # Write the transcript as UTF-8 text. Append a newline if the text doesn’t already end with one,
-    # which makes CLI pipelines and editors a bit happier.
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(text + ("\n" if text and not text.endswith("\n") else ""))
-
-    # Success message with the output path.
-    print(f"Done. Transcript written to: {out_path}")
-
 
 # This guard ensures main() only runs when:
 # - The module is executed directly (python -m transcriber.cli), or
@@ -1,11 +1,22 @@
-from typing import Optional, List
+import contextlib
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 class TranscribeError(Exception):
     pass
 
+# Supported devices and backends. The tuples keep a stable order for CLI choices/help;
+# the frozensets are built once for the membership checks on the transcribe path.
+DEVICES = ("cpu", "cuda")
+BACKENDS = ("whisper", "faster")
+_VALID_DEVICES = frozenset(DEVICES)
+_VALID_BACKENDS = frozenset(BACKENDS)
+
 def _auto_device(user_device: Optional[str]) -> str:
-        # Prefer user choice; otherwise try CUDA if torch is available
-        if user_device in {"cpu", "cuda"}:
+        # Prefer user choice; otherwise try CUDA if torch is available.
+        # Keep this check above the torch import: an explicit device must never pay for importing torch.
+        if user_device in _VALID_DEVICES:
             return user_device
         try:
             import torch  # local import to avoid heavy import at package import time
@@ -13,17 +24,59 @@ def _auto_device(user_device: Optional[str]) -> str:
         except Exception:
             return "cpu"
 
-def transcribe(
-    input_path: str,
-    model: str = "small",
-    language: Optional[str] = None,
-    device: Optional[str] = None,
-    backend: str = "whisper",
-) -> str:
+# GPUs with less memory than this run faster-whisper with int8 weights (int8_float16).
+# Cards report a bit less than their nominal size (an "8 GB" card shows ~7.8 GiB, a "6 GB"
+# one ~5.8 GiB), so 6 GiB puts cards of 6 GB and less on int8 and leaves 8 GB cards on float16.
+_LOW_VRAM_BYTES = 6 * 1024 ** 3
+
+def _cuda_compute_type() -> str:
     """
-    Return plain transcript text for a media file.
+    CTranslate2 compute type on CUDA: float16, or int8_float16 (int8 weights, half the
+    weight memory) when the GPU has little memory. The memory is only probed if torch is
+    already imported (e.g. by device auto-detection); faster-whisper itself doesn't need
+    torch, so we never import it just for this and keep float16 otherwise.
+    """
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return "float16"
+    try:
+        if torch.cuda.get_device_properties(0).total_memory < _LOW_VRAM_BYTES:
+            return "int8_float16"
+    except Exception:
+        pass
+    return "float16"
+
+# Batched faster-whisper on CUDA: throughput saturates around 8-16 chunks per pass,
+# and larger batches mostly cost GPU memory.
+DEFAULT_BATCH_SIZE = 16
+MAX_BATCH_SIZE = 32
+
+# Loaded models, keyed by backend, model, device and load options (compute type, threads).
+# Reused across calls in the same process (batch runs, library use, long-running wrappers);
+# see clear_model_cache().
+_MODEL_CACHE: Dict[Tuple[Any, ...], Any] = {}
+
+def clear_model_cache() -> None:
+    """Drop all cached models so their (GPU) memory can be freed."""
+    _MODEL_CACHE.clear()
+
+def _load_model(
+    model: str,
+    device: Optional[str],
+    backend: str,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+) -> Tuple[Any, str]:
+    """
+    Return (model object, resolved device), loading the model only if it isn't cached yet.
     backend: 'whisper' (openai-whisper) or 'faster' (faster-whisper).
+    Only the chosen backend is imported, and the device is resolved after that import
+    succeeded, so a missing backend fails fast without touching torch.
+    cpu_threads/num_workers are passed to faster-whisper's WhisperModel (0 = CTranslate2 default).
     """
+    if backend not in _VALID_BACKENDS:
+        raise TranscribeError(f"Unknown backend {backend!r}. Choose one of: {', '.join(BACKENDS)}")
+
     if backend == "faster":
         try:
             from faster_whisper import WhisperModel
@@ -31,35 +84,241 @@ def transcribe(
             raise TranscribeError("faster-whisper not installed. Try: pip install '.[faster]'") from e
 
         dev = _auto_device(device)
-        compute_type = "float16" if dev == "cuda" else "int8"
+        compute_type = _cuda_compute_type() if dev == "cuda" else "int8"
+        key = (backend, model, dev, compute_type, cpu_threads, num_workers)
+        if key not in _MODEL_CACHE:
+            try:
+                _MODEL_CACHE[key] = WhisperModel(
+                    model,
+                    device=dev,
+                    compute_type=compute_type,
+                    cpu_threads=cpu_threads,
+                    num_workers=num_workers,
+                )
+            except Exception as e:
+                raise TranscribeError(f"Transcription failed (faster-whisper): {e}") from e
+        return _MODEL_CACHE[key], dev
+
+    # openai-whisper as default
+    try:
+        import whisper
+    except ImportError as e:
+        raise TranscribeError("openai-whisper not installed. Try: pip install openai-whisper") from e
+
+    dev = _auto_device(device)
+    key = (backend, model, dev)
+    if key not in _MODEL_CACHE:
+        try:
+            _MODEL_CACHE[key] = whisper.load_model(model, device=dev)
+        except Exception as e:
+            raise TranscribeError(f"Transcription failed (whisper): {e}") from e
+    return _MODEL_CACHE[key], dev
+
+def _iter_text(
+    model_obj,
+    dev: str,
+    input_path: str,
+    language: Optional[str],
+    backend: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Yield raw transcript text pieces for one file with an already loaded model.
+    faster-whisper yields one piece per decoded segment; openai-whisper yields the whole text once.
+
+    On CUDA, faster-whisper decodes batch_size VAD chunks per forward pass through
+    BatchedInferencePipeline (faster-whisper >= 1.1); batch_size=1 or an older
+    faster-whisper falls back to the sequential path.
+    """
+    if backend == "faster":
+        pipeline = None
+        if dev == "cuda" and batch_size > 1:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                pipeline = BatchedInferencePipeline(model=model_obj)
+            except ImportError:
+                pass
         try:
-            model_obj = WhisperModel(model, device=dev, compute_type=compute_type)
-            segments, _ = model_obj.transcribe(
-                input_path,
-                language=language,
-                vad_filter=True,
-                condition_on_previous_text=False,
-            )
-            return "".join(s.text for s in segments).strip()
+            if pipeline is not None:
+                segments, _ = pipeline.transcribe(
+                    input_path,
+                    batch_size=batch_size,
+                    language=language,
+                    vad_filter=True,
+                    condition_on_previous_text=False,
+                )
+            else:
+                segments, _ = model_obj.transcribe(
+                    input_path,
+                    language=language,
+                    vad_filter=True,
+                    condition_on_previous_text=False,
+                )
+            for s in segments:  # lazy generator: decoding happens while we iterate
+                yield s.text
         except Exception as e:
             raise TranscribeError(f"Transcription failed (faster-whisper): {e}") from e
+        return
 
-    # openai-whisper as default
     try:
-        import whisper
-        dev = _auto_device(device)
-        model_obj = whisper.load_model(model, device=dev)
         result = model_obj.transcribe(
             input_path,
             language=language,
             verbose=False,
             condition_on_previous_text=False,
         )
-        return (result.get("text") or "").strip()
-    except ImportError as e:
-        raise TranscribeError("openai-whisper not installed. Try: pip install openai-whisper") from e
     except Exception as e:
         raise TranscribeError(f"Transcription failed (whisper): {e}") from e
+    yield result.get("text") or ""
+
+def _run_model(
+    model_obj,
+    dev: str,
+    input_path: str,
+    language: Optional[str],
+    backend: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> str:
+    """Transcribe one file with an already loaded model and return plain text."""
+    return "".join(_iter_text(model_obj, dev, input_path, language, backend, batch_size)).strip()
+
+# Process umask, read once: querying it means setting it, which is not thread-safe.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+@contextlib.contextmanager
+def _atomic_write(out_path: str) -> Iterator[int]:
+    """
+    Yield a writable fd (binary mode) for a fresh temp file next to out_path, and rename it
+    over out_path once the block completes, so a failure never leaves a truncated transcript
+    and readers never see a half-written one. On error the temp file is removed.
+    mkstemp picks a unique name, so concurrent writers and existing files are never touched.
+    """
+    import tempfile  # deferred: only needed when a transcript is written
+    out_dir = os.path.dirname(out_path) or "."
+    fd, tmp = tempfile.mkstemp(dir=out_dir, prefix=f".{os.path.basename(out_path)}.", suffix=".tmp")
+    try:
+        try:
+            # mkstemp creates 0600; give the transcript the usual permissions (0666 minus umask)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o666 & ~_UMASK)
+            else:  # Windows before Python 3.13
+                os.chmod(tmp, 0o666 & ~_UMASK)
+            yield fd
+        finally:
+            os.close(fd)
+        os.replace(tmp, out_path)  # atomic on POSIX and Windows
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+def _write_pieces(f: TextIO, pieces: Iterable[str]) -> None:
+    """
+    Write text pieces as they arrive, producing the same bytes as
+    f.write(text.strip() + "\n") for the joined text (nothing at all for empty text).
+    Trailing whitespace is held back until more text follows, so only O(segment) is buffered.
+    """
+    pending = ""      # whitespace that may turn out to be trailing
+    started = False   # leading whitespace is dropped until the first real character
+    for piece in pieces:
+        if not started:
+            piece = piece.lstrip()
+            if not piece:
+                continue
+            started = True
+        body = piece.rstrip()
+        if body:
+            f.write(pending + body)
+            pending = piece[len(body):]
+        else:
+            pending += piece
+    if started:
+        f.write("\n")
+
+def transcribe(
+    input_path: str,
+    model: str = "small",
+    language: Optional[str] = None,
+    device: Optional[str] = None,
+    backend: str = "whisper",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+) -> str:
+    """
+    Return plain transcript text for a media file.
+    backend: 'whisper' (openai-whisper) or 'faster' (faster-whisper).
+    batch_size: VAD chunks decoded per forward pass (faster-whisper on CUDA only).
+    cpu_threads/num_workers: CTranslate2 threads per worker and number of workers (faster-whisper only).
+    The model stays cached in-process, so repeated calls skip the load (see clear_model_cache).
+    """
+    model_obj, dev = _load_model(model, device, backend, cpu_threads, num_workers)
+    return _run_model(model_obj, dev, input_path, language, backend, batch_size)
+
+def transcribe_many(
+    input_paths: Iterable[str],
+    model: str = "small",
+    language: Optional[str] = None,
+    device: Optional[str] = None,
+    backend: str = "whisper",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (input_path, transcript text) for each media file, in order.
+    The model is loaded once and reused, so N files pay at most a single load cost.
+    """
+    model_obj = None
+    for input_path in input_paths:
+        if model_obj is None:
+            model_obj, dev = _load_model(model, device, backend, cpu_threads, num_workers)
+        yield input_path, _run_model(model_obj, dev, input_path, language, backend, batch_size)
+
+def transcribe_to_file(
+    input_path: str,
+    out_path: str,
+    model: str = "small",
+    language: Optional[str] = None,
+    device: Optional[str] = None,
+    backend: str = "whisper",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+) -> None:
+    """
+    Transcribe a media file straight into out_path (UTF-8, trailing newline).
+    Segments are written as they are decoded instead of being joined in memory first.
+    """
+    for _ in transcribe_many_to_files(
+        [(input_path, out_path)], model, language, device, backend, batch_size, cpu_threads, num_workers
+    ):
+        pass
+
+def transcribe_many_to_files(
+    jobs: Iterable[Tuple[str, str]],
+    model: str = "small",
+    language: Optional[str] = None,
+    device: Optional[str] = None,
+    backend: str = "whisper",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cpu_threads: int = 0,
+    num_workers: int = 1,
+) -> Iterator[str]:
+    """
+    Stream transcripts for (input_path, out_path) pairs to disk, yielding each out_path once written.
+    Like transcribe_many, the model is loaded once for all jobs. out_path only appears once
+    its transcript is complete.
+    """
+    model_obj = None
+    for input_path, out_path in jobs:
+        if model_obj is None:
+            model_obj, dev = _load_model(model, device, backend, cpu_threads, num_workers)
+        # newline="\n": write LF on every platform, like the CLI's byte-level writer
+        with _atomic_write(out_path) as fd, open(fd, "w", encoding="utf-8", newline="\n", closefd=False) as f:
+            _write_pieces(f, _iter_text(model_obj, dev, input_path, language, backend, batch_size))
+        yield out_path
 
 def transcribe_diarized(
     input_path: str,
@@ -72,12 +331,14 @@ def transcribe_diarized(
     Return a transcript with speaker labels using WhisperX + pyannote diarization.
     Requires: pip install '.[diarize]' and a Hugging Face token with access to pyannote models.
     """
-    dev = _auto_device(device)
     try:
         import whisperx
     except ImportError as e:
         raise TranscribeError("Missing dependency. Install: pip install '.[diarize]'") from e
 
+    # resolve the device only once whisperx imported, so a missing dependency never imports torch
+    dev = _auto_device(device)
+
     try:
         # 1) ASR
         asr_model = whisperx.load_model(model, device=dev)
@@ -0,0 +1,199 @@
+"""
+Persistent transcription daemon for the transcriber package.
+
+Responsibilities:
+- Listen on a Unix socket (`vid2txt --serve`) and keep the loaded model in memory
+  (core's in-process model cache), so only the first request per model pays the load.
+- Handle one JSON request per connection: transcribe `input` into `output`.
+- Provide the client half of the protocol, used by cli.py when a daemon is running.
+
+Protocol: the client sends one JSON line
+    {"input", "output", "model", "language", "device", "backend", "batch_size", "threads", "workers"}
+and receives one JSON line back: {"ok": true, "output": ...} or {"ok": false, "err": ...}.
+Paths must be absolute, since the daemon does not share the client's working directory.
+The daemon writes the transcript itself (streamed, like the in-process CLI).
+
+The socket lives in a directory only we can access, and clients only talk to a socket
+owned by the same user inside such a directory.
+
+Note: Unix only (AF_UNIX); elsewhere the CLI always transcribes in-process.
+"""
+
+import contextlib
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+
+def socket_path() -> str:
+    """
+    Default socket location: a private (0700) directory in the per-user runtime dir if
+    available, else in the temp dir (with the uid in its name so users don't collide).
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base:
+        return os.path.join(base, "transcriber", "daemon.sock")
+    import tempfile  # only needed without XDG_RUNTIME_DIR
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"transcriber-{uid}", "daemon.sock")
+
+def _owned_by_us(st: os.stat_result) -> bool:
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+def _is_private_dir(path: str) -> bool:
+    """True if path is a real directory (not a symlink) owned by us and closed to group/others."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and _owned_by_us(st) and not st.st_mode & 0o077
+
+def _is_our_socket(path: str) -> bool:
+    """
+    True if path is a socket we created, inside a private directory of ours.
+    Anything else could have been planted by another local user (e.g. in a shared /tmp),
+    and talking to it would hand them our input and output paths.
+    """
+    if not _is_private_dir(os.path.dirname(path)):
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and _owned_by_us(st)
+
+# Load options of the model currently cached by core. The daemon keeps a single model:
+# when a request needs a different one, the old one is dropped first to free RAM/VRAM.
+_model_key: Optional[Tuple[Any, ...]] = None
+
+def _handle(req: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one request with the in-process model cache and build the reply."""
+    from .core import DEFAULT_BATCH_SIZE, TranscribeError, clear_model_cache, transcribe_to_file
+
+    global _model_key
+    key = tuple(req.get(k) for k in ("model", "device", "backend", "threads", "workers"))
+    if key != _model_key:
+        clear_model_cache()
+        _model_key = key
+
+    try:
+        transcribe_to_file(
+            req["input"],
+            req["output"],
+            model=req.get("model") or "small",
+            language=req.get("language"),
+            device=req.get("device"),
+            backend=req.get("backend") or "whisper",
+            batch_size=req.get("batch_size") or DEFAULT_BATCH_SIZE,
+            cpu_threads=req.get("threads") or 0,
+            num_workers=req.get("workers") or 1,
+        )
+        return {"ok": True, "output": req["output"]}
+    except TranscribeError as e:
+        return {"ok": False, "err": str(e)}
+    except Exception as e:
+        return {"ok": False, "err": f"Unexpected error: {e}"}
+
+def _bind(path: str):
+    """
+    Create the listening server on path, inside a private directory.
+    Exits with a message if the directory isn't ours or another daemon is already running.
+    """
+    import socketserver
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            line = self.rfile.readline()
+            if not line:
+                return  # connect-and-close probe, e.g. a second --serve checking for us
+            try:
+                req = json.loads(line)
+            except ValueError:
+                req = None
+            if not isinstance(req, dict):
+                reply = {"ok": False, "err": "Invalid request."}
+            else:
+                reply = _handle(req)
+                status = "ok" if reply["ok"] else reply["err"]
+                print(f"{req.get('input')}: {status}", file=sys.stderr)
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+    sock_dir = os.path.dirname(path)
+    try:
+        os.mkdir(sock_dir, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        sys.exit(f"Cannot create socket directory {sock_dir}: {e}")
+    if not _is_private_dir(sock_dir):
+        sys.exit(f"Refusing to serve: {sock_dir} must be a directory owned by you with mode 0700.")
+
+    running = connect(path)
+    if running is not None:
+        running.close()
+        sys.exit(f"Transcription daemon already running on {path}.")
+    try:
+        os.unlink(path)  # stale socket from a previous run
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        sys.exit(f"Cannot remove stale socket {path}: {e}")
+
+    # Create the socket owner-only: requests make the daemon read and write files as this user.
+    old_umask = os.umask(0o177)
+    try:
+        return socketserver.UnixStreamServer(path, _Handler)
+    finally:
+        os.umask(old_umask)
+
+def serve(path: Optional[str] = None) -> None:
+    """
+    Serve transcription requests on a Unix socket until interrupted (Ctrl+C or SIGTERM).
+    Requests are handled one at a time, so concurrent clients queue instead of
+    competing for the same model/GPU.
+    """
+    path = path or socket_path()
+    server = _bind(path)
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt  # treat `kill` like Ctrl+C so the socket file gets removed
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    print(f"Serving on {path} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+def connect(path: Optional[str] = None) -> Optional[socket.socket]:
+    """Return a socket connected to a running daemon of ours, or None if there is none."""
+    path = path or socket_path()
+    if not hasattr(socket, "AF_UNIX") or not _is_our_socket(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        # stale socket file (daemon gone) or no permission: not usable
+        sock.close()
+        return None
+    return sock
+
+def request(sock: socket.socket, req: Dict[str, Any]) -> Dict[str, Any]:
+    """Send one request over a connected socket, wait for the reply and close the socket."""
+    with sock, sock.makefile("rwb") as f:
+        f.write(json.dumps(req).encode("utf-8") + b"\n")
+        f.flush()
+        line = f.readline()
+    if not line:
+        return {"ok": False, "err": "Transcription daemon closed the connection."}
+    return json.loads(line)